@@ -7,10 +7,59 @@
 #
 # This is the outermost layer of the part of the program that you'll need to build,
 # which means that YOU WILL DEFINITELY NEED TO MAKE CHANGES TO THIS FILE.
+from collections import OrderedDict
+from pathlib import Path
 import sqlite3
 from p2app import events
 
 
+
+# Indexes on the searched columns that the schema doesn't already provide. The code
+# columns (continent_code, country_code, region_code) are UNIQUE, so SQLite already
+# indexes them.
+_SEARCH_INDEXES = {
+    'ix_continent_name': 'continent (name)',
+    'ix_country_name': 'country (name)',
+    'ix_region_local_code': 'region (local_code)',
+    'ix_region_name': 'region (name)'
+}
+
+
+# The most search results sent to the UI in a single *SearchResultsEvent.
+_SEARCH_CHUNK_SIZE = 50
+
+# The most continents, countries or regions each kept in the engine's load cache.
+_LOAD_CACHE_SIZE = 1024
+
+# Events for failures whose message never changes. Events are immutable, so one
+# instance of each is shared rather than rebuilt every time the failure occurs.
+_NOT_A_DATABASE_ERR = events.DatabaseOpenFailedEvent("The file is not a valid SQLite database.")
+_NOT_AN_AIRPORT_DATABASE_ERR = events.DatabaseOpenFailedEvent(
+    "The file is a SQLite database, but not a Learning to Fly airport database.")
+_NO_CONTINENT_INPUT_ERR = events.ErrorEvent("No continent code or continent name has been provided.")
+_NO_CONTINENTS_ERR = events.ErrorEvent("No continents have been found.")
+_NO_COUNTRY_INPUT_ERR = events.ErrorEvent("No country code or country name has been provided.")
+_NO_COUNTRIES_ERR = events.ErrorEvent("No countries have been found.")
+_NO_REGION_INPUT_ERR = events.ErrorEvent("No region code, local code, or region name has been provided.")
+_NO_REGIONS_ERR = events.ErrorEvent("No regions have been found.")
+_UNRECOGNIZED_EVENT_ERR = events.ErrorEvent("Received an unrecognized event.")
+
+
+def _continent_factory(cursor, row):
+    """Row factory that builds a Continent directly from a continent query's row."""
+    return events.Continent._make(row)
+
+
+def _country_factory(cursor, row):
+    """Row factory that builds a Country directly from a country query's row."""
+    return events.Country._make(row)
+
+
+def _region_factory(cursor, row):
+    """Row factory that builds a Region directly from a region query's row."""
+    return events.Region._make(row)
+
+
 class Engine:
     """An object that represents the application's engine, whose main role is to
     process events sent to it by the user interface, then generate events that are
@@ -18,19 +67,56 @@ class Engine:
     unaware of any details of how the engine is implemented.
     """
 
-    def __init__(self):
+    def __init__(self, debug=False):
         """
         Initializes the engine. Contains the engine's connection to the database
         and a dictionary of events as keys and functions as values. The dictionary
         is processed by process_event to call the associated function when engine receives
-        an event.
+        an event. When debug is True, every SQL statement the engine executes is printed;
+        the event bus changes this later through set_debug_mode.
         """
         self._connection = None
+        self._debug = debug
+        self._cursor_ = None
+        self._in_batch = False
+
+        # Least-recently-used caches of loaded rows, keyed by primary key, so that
+        # reloading the same continent, country or region skips SQLite entirely.
+        self._continent_cache = OrderedDict()
+        self._country_cache = OrderedDict()
+        self._region_cache = OrderedDict()
+        self._prepare_statements()
+
+        # Every combination of populated search filters, precomputed once and keyed by
+        # a bitmask of which filters are present (see _search_query).
+        self._continent_search = self._build_search_statements(
+            '''
+            SELECT continent_id, continent_code, name
+            FROM continent
+            ''',
+            ['continent_code', 'name'])
+
+        self._country_search = self._build_search_statements(
+            '''
+            SELECT country_id, country_code, name, continent_id, wikipedia_link, keywords
+            FROM country
+            ''',
+            ['country_code', 'name'])
+
+        self._region_search = self._build_search_statements(
+            '''
+            SELECT region_id, region_code, local_code, name, continent_id, country_id, wikipedia_link, keywords
+            FROM region
+            ''',
+            ['region_code', 'local_code', 'name'])
+
         self._handlers = {
             # Application-level functions
             events.OpenDatabaseEvent: self._handle_open_database,
             events.CloseDatabaseEvent: self._handle_close_database,
             events.QuitInitiatedEvent: self._handle_quit_application,
+            events.BeginBatchEvent: self._handle_begin_batch,
+            events.EndBatchEvent: self._handle_end_batch,
 
             # Continent-related functions
             events.StartContinentSearchEvent: self._handle_search_continent,
@@ -43,112 +129,385 @@ class Engine:
             events.LoadCountryEvent: self._handle_load_country,
             events.SaveNewCountryEvent: self._handle_save_new_country,
             events.SaveCountryEvent: self._handle_save_country,
+            events.SaveNewCountriesEvent: self._handle_save_new_country_bulk,
 
             # Region-related functions
             events.StartRegionSearchEvent: self._handle_search_region,
             events.LoadRegionEvent: self._handle_load_region,
             events.SaveNewRegionEvent: self._handle_save_new_region,
-            events.SaveRegionEvent: self._handle_save_region
+            events.SaveRegionEvent: self._handle_save_region,
+            events.SaveNewRegionsEvent: self._handle_save_new_region_bulk,
+            events.UpsertRegionEvent: self._handle_upsert_region
         }
 
+        # Event classes are module-level singletons, so their ids are stable and can
+        # key the dispatch table without hashing the class objects on every event.
+        self._handlers_by_id = {id(k): v for k, v in self._handlers.items()}
+        self._dispatch = self._handlers_by_id.get
+        self._unrecognized = self._handle_unrecognized
 
-    def process_event(self, event):
-        """A generator function that processes one event sent from the user interface,
-        yielding zero or more events in response. The function receives events, searches
-        through self._handlers, then yields the associated function.
+
+    @staticmethod
+    def _build_search_statements(base_query, columns):
+        """
+        Returns a dictionary mapping each non-empty bitmask of filter columns to the
+        search query that filters on exactly those columns. Bit i of the mask
+        corresponds to columns[i].
+        """
+        statements = {}
+        for mask in range(1, 1 << len(columns)):
+            clauses = [f'{column} = ?' for bit, column in enumerate(columns) if mask & (1 << bit)]
+            statements[mask] = base_query + 'WHERE ' + ' AND '.join(clauses)
+        return statements
+
+    @staticmethod
+    def _search_query(statements, *values):
+        """
+        Returns the query in statements (as built by _build_search_statements) that filters
+        on exactly the populated values, along with those values as its parameters.
         """
+        mask = 0
+        params = []
+        for bit, value in enumerate(values):
+            if value:
+                mask |= 1 << bit
+                params.append(value)
+        return statements[mask], tuple(params)
 
-        # This is a way to write a generator function that always yields zero values.
-        # You'll want to remove this and replace it with your own code, once you start
-        # writing your engine, but this at least allows the program to run.
-        handler = self._handlers.get(type(event), self._handle_unrecognized)
-        yield from handler(event)
+    def process_event(self, event):
+        """Processes one event sent from the user interface, returning an iterable of
+        zero or more events in response. The function receives events, searches
+        through self._handlers_by_id, then returns the associated function's results
+        directly rather than wrapping them in another generator.
+
+        Handlers that respond with a fixed number of events return them as a tuple; only
+        the search handlers, whose result count is unbounded, are generators.
+        """
+        return self._dispatch(id(event.__class__), self._unrecognized)(event)
 
     def _handle_open_database(self, event):
         """
         Handles opening the database and returns DatabaseOpenFailedEvent if user's file is not a database.
         """
+        self._reset_connection()
         try:
-            self._connection = sqlite3.connect(event.path())
-            # Test if the input file is a valid SQLite database, if simple query fails
-            # yield a user-friendly error.
-            cursor = self._connection.cursor()
-            cursor.execute("PRAGMA foreign_keys = ON;")
-            cursor.execute("PRAGMA schema_version;")
-            cursor.fetchone()
-
-            yield events.DatabaseOpenedEvent(event.path())
-
+            # mode=rw refuses to create a new, empty database when the file doesn't exist.
+            uri = f'{Path(event.path()).resolve().as_uri()}?mode=rw'
+            self._connection = sqlite3.connect(
+                uri, uri=True, cached_statements=256, isolation_level=None)
+            if self._debug:
+                self._connection.set_trace_callback(self._trace)
+            # Probing a table the airport schema is known to have checks both that the file
+            # is a valid SQLite database (otherwise DatabaseError is raised) and that it's
+            # an airport database rather than some other one (otherwise there's no such table).
+            # This is done first so that other files are never switched to WAL.
+            # Any other failure, such as the file being locked, is left to the handlers below.
+            try:
+                self._connection.execute("SELECT 1 FROM continent LIMIT 1;").fetchall()
+            except sqlite3.OperationalError as e:
+                if not str(e).startswith('no such table'):
+                    raise
+                self._reset_connection()
+                return (_NOT_AN_AIRPORT_DATABASE_ERR,)
+
+            try:
+                self._connection.execute("PRAGMA journal_mode = WAL;")
+            except sqlite3.OperationalError:
+                # A read-only file can't switch to WAL; keep its existing journal mode.
+                pass
+            self._connection.executescript("""
+                PRAGMA synchronous = NORMAL;
+                PRAGMA temp_store = MEMORY;
+                PRAGMA cache_size = -65536;
+                PRAGMA mmap_size = 268435456;
+                PRAGMA foreign_keys = ON;
+                """)
+
+            self._create_search_indexes()
+            return (events.DatabaseOpenedEvent(event.path()),)
+
+        except sqlite3.OperationalError as e:
+            # The file is missing, unreadable or locked, rather than not being a database.
+            self._reset_connection()
+            return (events.DatabaseOpenFailedEvent(f"The database could not be opened - {e}"),)
         except sqlite3.DatabaseError:
-            if self._connection:
-                self._connection.close()
-                self._connection = None
-            yield events.DatabaseOpenFailedEvent(f"The file is not a valid SQLite database.")
+            self._reset_connection()
+            return (_NOT_A_DATABASE_ERR,)
         except Exception as e:
-            if self._connection:
-                self._connection.close()
-                self._connection = None
-            yield events.DatabaseOpenFailedEvent(f"An unexpected error occurred: {e}")
+            self._reset_connection()
+            return (events.DatabaseOpenFailedEvent(f"An unexpected error occurred: {e}"),)
+
+    def _create_search_indexes(self):
+        """
+        Creates any of the indexes in _SEARCH_INDEXES that the database is missing, then
+        runs ANALYZE on the searched tables so the query planner has statistics to choose
+        them. The much larger airport tables are never searched, so they aren't analyzed.
+        Databases that already have every index are left untouched, so this is only paid
+        on first open. Read-only databases are skipped.
+        """
+        existing = {name for name, in self._connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+        missing = [name for name in _SEARCH_INDEXES if name not in existing]
+        if not missing:
+            return
+
+        script = ''.join(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {_SEARCH_INDEXES[name]}; ' for name in missing)
+        script += 'ANALYZE continent; ANALYZE country; ANALYZE region;'
+
+        try:
+            self._connection.executescript(script)
+        except sqlite3.OperationalError:
+            pass
+
+    def _prepare_statements(self):
+        """
+        Builds every fixed SQL statement the handlers execute, keyed by handler, so that
+        each handler passes the exact same string to SQLite on every call and hits the
+        connection's statement cache instead of re-compiling the query. The statements
+        don't depend on the database, so this is done once when the engine is created.
+        """
+        self._stmts = {
+            'load_continent': '''
+                    SELECT continent_id, continent_code, name
+                    FROM continent
+                    WHERE continent_id = ?
+                    ''',
+            'save_new_continent': '''
+                    INSERT INTO continent (continent_id, continent_code, name) VALUES (?, ?, ?)
+                    ''',
+            'save_continent': '''
+                    UPDATE continent 
+                    SET name = ?, continent_code = ? 
+                    WHERE continent_id = ?
+                    ''',
+            'load_country': '''
+                    SELECT country_id, country_code, name, continent_id, wikipedia_link, keywords
+                    FROM country
+                    WHERE country_id = ?
+                    ''',
+            'save_new_country': '''
+                    INSERT INTO country (country_id, country_code, name, continent_id, wikipedia_link, keywords) 
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ''',
+            'save_country': '''
+                    UPDATE country 
+                    SET name = ?, country_code = ?, continent_id = ?, wikipedia_link = ?, keywords = ?
+                    WHERE country_id = ?
+                    ''',
+            'load_region': '''
+                    SELECT region_id, region_code, local_code, name, continent_id, country_id, wikipedia_link, keywords
+                    FROM region
+                    WHERE region_id = ?
+                    ''',
+            'save_new_region': '''
+                    INSERT INTO region (region_id, region_code, local_code, name, continent_id, country_id, wikipedia_link, keywords) 
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ''',
+            'save_region': '''
+                    UPDATE region 
+                    SET region_code = ?, local_code = ?, name = ?, continent_id = ?, country_id = ?, wikipedia_link = ?, keywords = ?
+                    WHERE region_id = ?
+                    ''',
+            'upsert_region': '''
+                    INSERT INTO region (region_id, region_code, local_code, name, continent_id, country_id, wikipedia_link, keywords) 
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (region_id) DO UPDATE
+                    SET region_code = excluded.region_code, local_code = excluded.local_code, name = excluded.name,
+                        continent_id = excluded.continent_id, country_id = excluded.country_id,
+                        wikipedia_link = excluded.wikipedia_link, keywords = excluded.keywords
+                    '''
+        }
 
     def _handle_close_database(self, event):
         """
         Closes the database connection and yields DatabaseClosedEvent.
+        Runs PRAGMA optimize first so the query planner has fresh statistics next session.
+        """
+        if self._connection:
+            try:
+                self._connection.executescript("PRAGMA analysis_limit = 400; PRAGMA optimize;")
+            except sqlite3.Error:
+                pass
+        self._reset_connection()
+        return (events.DatabaseClosedEvent(),)
+
+    def set_debug_mode(self, debug):
         """
+        Turns debug mode on or off, installing or removing the trace callback on the
+        open connection, if there is one. The event bus calls this when the user
+        toggles debug mode.
+        """
+        self._debug = debug
         if self._connection:
-            self._connection.close()
-            self._connection = None
-        yield events.DatabaseClosedEvent()
+            self._connection.set_trace_callback(self._trace if debug else None)
+
+    @staticmethod
+    def _trace(statement):
+        """
+        Trace callback installed in debug mode. Prints each statement SQLite executes,
+        with its parameters bound, so hot or slow queries can be spotted.
+        """
+        print(f'SQL executed  : {statement}')
+
+    def _reset_connection(self):
+        """
+        Closes the database connection, if there is one, and forgets it. A batch that is
+        still in progress is committed first, since its saves were already reported to
+        the UI as saved.
+        """
+        connection, self._connection = self._connection, None
+        in_batch, self._in_batch = self._in_batch, False
+        self._cursor_ = None
+        self._continent_cache.clear()
+        self._country_cache.clear()
+        self._region_cache.clear()
+        if connection:
+            if in_batch:
+                try:
+                    connection.execute("COMMIT")
+                except sqlite3.Error:
+                    pass
+            connection.close()
 
     def _handle_quit_application(self, event):
         """
         Quits application by yielding EndApplicationEvent.
+        Closes the database connection first, committing a batch that is still in
+        progress, since the application exits once EndApplicationEvent is handled.
+        """
+        self._reset_connection()
+        return (events.EndApplicationEvent(),)
+
+    def _handle_begin_batch(self, event):
+        """
+        Opens an explicit transaction so that the saves which follow share a single
+        commit, until EndBatchEvent is received. Yields a customized ErrorEvent if the
+        transaction cannot be started.
+        """
+        if self._connection is None or self._in_batch:
+            return ()
+
+        try:
+            self._connection.execute("BEGIN")
+            self._in_batch = True
+            return ()
+        except Exception as e:
+            return (events.ErrorEvent(f"Could not start a batch due to an unexpected error - {e}"),)
+
+    def _handle_end_batch(self, event):
+        """
+        Commits the transaction opened by BeginBatchEvent.
+        Yields a customized ErrorEvent if the commit fails.
+        """
+        if self._connection is None or not self._in_batch:
+            return ()
+
+        try:
+            self._connection.execute("COMMIT")
+            self._in_batch = False
+            return ()
+        except Exception as e:
+            return (events.ErrorEvent(f"Could not commit the batch due to an unexpected error - {e}"),)
+
+    @staticmethod
+    def _cache_get(cache, key):
+        """
+        Returns the value cached under key, marking it most recently used, or None if
+        it isn't cached.
+        """
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _cache_put(cache, key, value):
+        """
+        Caches value under key, evicting the least recently used entry if the cache
+        grows beyond _LOAD_CACHE_SIZE.
+        """
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > _LOAD_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _execute_many(self, query, params):
+        """
+        Executes query once per parameter tuple with a single executemany call, which
+        reuses one compiled statement for every row. Either all of the rows are saved or
+        none are: outside a batch they're written in their own transaction, and inside a
+        batch under a savepoint that's rolled back if any row fails.
+        """
+        if self._in_batch:
+            self._connection.execute("SAVEPOINT bulk_save")
+            try:
+                self._cursor().executemany(query, params)
+            except Exception:
+                self._connection.execute("ROLLBACK TO bulk_save")
+                self._connection.execute("RELEASE bulk_save")
+                raise
+            self._connection.execute("RELEASE bulk_save")
+            return
+
+        self._connection.execute("BEGIN")
+        try:
+            self._cursor().executemany(query, params)
+        except Exception:
+            self._connection.rollback()
+            raise
+        self._connection.commit()
+
+    def _cursor(self):
         """
-        yield events.EndApplicationEvent()
+        Returns the engine's cursor on the current connection, creating it the first time
+        it's needed, so handlers reuse one cursor rather than allocating one per event.
+        Callers that fetch rows set the cursor's row_factory before executing.
+        """
+        if self._cursor_ is None:
+            self._cursor_ = self._connection.cursor()
+        return self._cursor_
 
     def _handle_search_continent(self, event):
         """
         Performs a SQLite query to search the airport database by continent code or name.
-        Returns found continents to the UI by yielding ContinentSearchResultEvent.
+        Returns found continents to the UI by yielding ContinentSearchResultsEvent
+        in chunks of up to _SEARCH_CHUNK_SIZE results.
         Yields a customized ErrorEvent for specific errors.
         """
         if self._connection is None:
             return
 
         try:
-            input_code = (event.continent_code() or '').strip()
-            input_name = (event.name() or '').strip()
+            input_code = event.continent_code()
+            input_code = input_code.strip() if input_code else ''
+            input_name = event.name()
+            input_name = input_name.strip() if input_name else ''
 
             if not input_code and not input_name:
                 # Possibly raise exception.
-                yield events.ErrorEvent(f"No continent code or continent name has been provided.")
+                yield _NO_CONTINENT_INPUT_ERR
                 return
 
-            query = '''
-                    SELECT continent_id, continent_code, name
-                    FROM continent
-                    WHERE TRUE
-                    '''
-
-            params = []
-            if input_code:
-                query += ' AND continent_code = ? '
-                params.append(input_code)
+            query, params = self._search_query(self._continent_search, input_code, input_name)
 
-            if input_name:
-                query += ' AND name = ? '
-                params.append(input_name)
-
-            cursor = self._connection.cursor()
+            cursor = self._cursor()
+            cursor.row_factory = _continent_factory
             cursor.execute(query, params)
 
-            rows = cursor.fetchall()
-            if not rows:
-                yield events.ErrorEvent(f"No continents have been found.")
+            # Fetch results in chunks so that the first ones reach the UI as soon as SQLite
+            # produces them, while the UI handles one event per chunk rather than per row.
+            fetch_chunk = cursor.fetchmany
+            make_event = events.ContinentSearchResultsEvent
+
+            continents = fetch_chunk(_SEARCH_CHUNK_SIZE)
+            if not continents:
+                yield _NO_CONTINENTS_ERR
                 return
 
-            for row in rows:
-                continent = events.Continent(*row)
-                yield events.ContinentSearchResultEvent(continent)
+            while continents:
+                yield make_event(tuple(continents))
+                continents = fetch_chunk(_SEARCH_CHUNK_SIZE)
 
         except Exception as e:
             yield events.ErrorEvent(f"Cannot search continent due to an unexpected error - {e}")
@@ -162,20 +521,21 @@ class Engine:
         """
         try:
             continent_id = event.continent_id()
-            cursor = self._connection.cursor()
-            query = '''
-                    SELECT continent_id, continent_code, name
-                    FROM continent
-                    WHERE continent_id = ?
-                    '''
-
-            cursor.execute(query, [continent_id])
-            row = cursor.fetchone()
-            if row:
-                continent = events.Continent(*row)
-                yield events.ContinentLoadedEvent(continent)
+            continent = self._cache_get(self._continent_cache, continent_id)
+            if continent:
+                return (events.ContinentLoadedEvent(continent),)
+
+            query = self._stmts['load_continent']
+            cursor = self._cursor()
+            cursor.row_factory = _continent_factory
+            cursor.execute(query, (continent_id,))
+            continent = cursor.fetchone()
+            if continent:
+                self._cache_put(self._continent_cache, continent_id, continent)
+                return (events.ContinentLoadedEvent(continent),)
+            return ()
         except Exception as e:
-            yield events.ErrorEvent(f"Failed to load continent due to an unexpected error - {e}")
+            return (events.ErrorEvent(f"Failed to load continent due to an unexpected error - {e}"),)
 
 
     def _handle_save_new_continent(self, event):
@@ -186,15 +546,12 @@ class Engine:
         """
         try:
             continent = event.continent()
-            cursor = self._connection.cursor()
-            query = '''
-                    INSERT INTO continent (continent_id, continent_code, name) VALUES (?, ?, ?)
-                    '''
-            cursor.execute(query, [continent.continent_id, continent.continent_code, continent.name])
-            self._connection.commit()
-            yield events.ContinentSavedEvent(continent)
+            self._continent_cache.pop(continent.continent_id, None)
+            query = self._stmts['save_new_continent']
+            self._cursor().execute(query, (continent.continent_id, continent.continent_code, continent.name))
+            return (events.ContinentSavedEvent(continent),)
         except Exception as e:
-            yield events.SaveContinentFailedEvent(f"Could not save new continent because of an error - {e}")
+            return (events.SaveContinentFailedEvent(f"Could not save new continent because of an error - {e}"),)
 
     def _handle_save_continent(self, event):
         """
@@ -204,61 +561,52 @@ class Engine:
         """
         try:
             continent = event.continent()
-            cursor = self._connection.cursor()
-            query = '''
-                    UPDATE continent 
-                    SET name = ?, continent_code = ? 
-                    WHERE continent_id = ?
-                    '''
-            cursor.execute(query,
-                           [continent.name, continent.continent_code, continent.continent_id])
-            self._connection.commit()
-            yield events.ContinentSavedEvent(continent)
+            self._continent_cache.pop(continent.continent_id, None)
+            query = self._stmts['save_continent']
+            self._cursor().execute(query,
+                                   (continent.name, continent.continent_code, continent.continent_id))
+            return (events.ContinentSavedEvent(continent),)
         except Exception as e:
-            yield events.SaveContinentFailedEvent(f"Could not update continent because of an error - {e}")
+            return (events.SaveContinentFailedEvent(f"Could not update continent because of an error - {e}"),)
 
     def _handle_search_country(self, event):
         """
         Performs a SQLite query to search the airport database by country code or name.
-        Returns found continents to the UI by yielding CountrySearchResultEvent.
+        Returns found continents to the UI by yielding CountrySearchResultsEvent
+        in chunks of up to _SEARCH_CHUNK_SIZE results.
         Yields a customized ErrorEvent for specific errors.
         """
         if self._connection is None:
             return
 
         try:
-            input_code = (event.country_code() or '').strip()
-            input_name = (event.name() or '').strip()
+            input_code = event.country_code()
+            input_code = input_code.strip() if input_code else ''
+            input_name = event.name()
+            input_name = input_name.strip() if input_name else ''
 
             if not input_code and not input_name:
-                yield events.ErrorEvent(f"No country code or country name has been provided.")
+                yield _NO_COUNTRY_INPUT_ERR
                 return
 
-            query = '''
-                    SELECT country_id, country_code, name, continent_id, wikipedia_link, keywords
-                    FROM country
-                    WHERE TRUE
-                    '''
-
-            params = []
-            if input_code:
-                query += ' AND country_code = ? '
-                params.append(input_code)
-
-            if input_name:
-                query += ' AND name = ? '
-                params.append(input_name)
+            query, params = self._search_query(self._country_search, input_code, input_name)
 
-            cursor = self._connection.cursor()
+            cursor = self._cursor()
+            cursor.row_factory = _country_factory
             cursor.execute(query, params)
-            rows = cursor.fetchall()
-            if not rows:
-                yield events.ErrorEvent(f"No countries have been found.")
+            # Fetch results in chunks so that the first ones reach the UI as soon as SQLite
+            # produces them, while the UI handles one event per chunk rather than per row.
+            fetch_chunk = cursor.fetchmany
+            make_event = events.CountrySearchResultsEvent
+
+            countries = fetch_chunk(_SEARCH_CHUNK_SIZE)
+            if not countries:
+                yield _NO_COUNTRIES_ERR
                 return
 
-            for row in rows:
-                country = events.Country(*row)
-                yield events.CountrySearchResultEvent(country)
+            while countries:
+                yield make_event(tuple(countries))
+                countries = fetch_chunk(_SEARCH_CHUNK_SIZE)
 
         except Exception as e:
             yield events.ErrorEvent(f"Failed to search country due to an unexpected error - {e}")
@@ -272,20 +620,21 @@ class Engine:
         """
         try:
             country_id = event.country_id()
-            cursor = self._connection.cursor()
-            query = '''
-                    SELECT country_id, country_code, name, continent_id, wikipedia_link, keywords
-                    FROM country
-                    WHERE country_id = ?
-                    '''
-
-            cursor.execute(query, [country_id])
-            row = cursor.fetchone()
-            if row:
-                country = events.Country(*row)
-                yield events.CountryLoadedEvent(country)
+            country = self._cache_get(self._country_cache, country_id)
+            if country:
+                return (events.CountryLoadedEvent(country),)
+
+            query = self._stmts['load_country']
+            cursor = self._cursor()
+            cursor.row_factory = _country_factory
+            cursor.execute(query, (country_id,))
+            country = cursor.fetchone()
+            if country:
+                self._cache_put(self._country_cache, country_id, country)
+                return (events.CountryLoadedEvent(country),)
+            return ()
         except Exception as e:
-            yield events.ErrorEvent(f"Failed to load country due to an unexpected error - {e}")
+            return (events.ErrorEvent(f"Failed to load country due to an unexpected error - {e}"),)
 
 
     def _handle_save_new_country(self, event):
@@ -296,23 +645,45 @@ class Engine:
         """
         try:
             country = event.country()
-            cursor = self._connection.cursor()
-            query = '''
-                    INSERT INTO country (country_id, country_code, name, continent_id, wikipedia_link, keywords) 
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    '''
-            cursor.execute(query,
-                           [country.country_id,
-                            country.country_code,
-                            country.name,
-                            country.continent_id,
-                            country.wikipedia_link,
-                            country.keywords if country.keywords else None])
-            self._connection.commit()
-            yield events.CountrySavedEvent(country)
+            self._country_cache.pop(country.country_id, None)
+            keywords = country.keywords or None
+            query = self._stmts['save_new_country']
+            self._cursor().execute(query,
+                                   (country.country_id,
+                                    country.country_code,
+                                    country.name,
+                                    country.continent_id,
+                                    country.wikipedia_link,
+                                    keywords))
+            return (events.CountrySavedEvent(country),)
+        except Exception as e:
+            return (events.SaveCountryFailedEvent(
+                f"Could not save new country because of an error - {e}"),)
+
+    def _handle_save_new_country_bulk(self, event):
+        """
+        Saves many new rows to the table 'country' with a single executemany call inside
+        one transaction (or the current batch), by yielding CountriesSavedEvent.
+        Yields SaveCountryFailedEvent if saving to the database fails, in which case none
+        of the countries are saved.
+        """
+        try:
+            countries = event.countries()
+            for country in countries:
+                self._country_cache.pop(country.country_id, None)
+            query = self._stmts['save_new_country']
+            params = [(country.country_id,
+                       country.country_code,
+                       country.name,
+                       country.continent_id,
+                       country.wikipedia_link,
+                       country.keywords or None)
+                      for country in countries]
+            self._execute_many(query, params)
+            return (events.CountriesSavedEvent(countries),)
         except Exception as e:
-            yield events.SaveCountryFailedEvent(
-                f"Could not save new country because of an error - {e}")
+            return (events.SaveCountryFailedEvent(
+                f"Could not save new countries because of an error - {e}"),)
 
     def _handle_save_country(self, event):
         """
@@ -322,72 +693,62 @@ class Engine:
         """
         try:
             country = event.country()
-            cursor = self._connection.cursor()
-            query = '''
-                    UPDATE country 
-                    SET name = ?, country_code = ?, continent_id = ?, wikipedia_link = ?, keywords = ?
-                    WHERE country_id = ?
-                    '''
-            cursor.execute(query,
-                           [country.name,
-                            country.country_code,
-                            country.continent_id,
-                            country.wikipedia_link,
-                            country.keywords if country.keywords else None,
-                            country.country_id])
-            self._connection.commit()
-            yield events.CountrySavedEvent(country)
+            self._country_cache.pop(country.country_id, None)
+            keywords = country.keywords or None
+            query = self._stmts['save_country']
+            self._cursor().execute(query,
+                                   (country.name,
+                                    country.country_code,
+                                    country.continent_id,
+                                    country.wikipedia_link,
+                                    keywords,
+                                    country.country_id))
+            return (events.CountrySavedEvent(country),)
         except Exception as e:
-            yield events.SaveCountryFailedEvent(f"Could not update country because of an error - {e}")
+            return (events.SaveCountryFailedEvent(f"Could not update country because of an error - {e}"),)
 
     def _handle_search_region(self, event):
         """
         Performs a SQLite query to search the airport database
         by region code, local code or name.
-        Returns found continents to the UI by yielding RegionSearchResultEvent.
+        Returns found continents to the UI by yielding RegionSearchResultsEvent
+        in chunks of up to _SEARCH_CHUNK_SIZE results.
         Yields a customized ErrorEvent for specific errors.
         """
         if self._connection is None:
             return
 
         try:
-            input_region_code = (event.region_code() or '').strip()
-            input_local_code = (event.local_code() or '').strip()
-            input_name = (event.name() or '').strip()
+            input_region_code = event.region_code()
+            input_region_code = input_region_code.strip() if input_region_code else ''
+            input_local_code = event.local_code()
+            input_local_code = input_local_code.strip() if input_local_code else ''
+            input_name = event.name()
+            input_name = input_name.strip() if input_name else ''
 
             if not input_region_code and not input_local_code  and not input_name:
-                yield events.ErrorEvent(f"No region code, local code, or region name has been provided.")
+                yield _NO_REGION_INPUT_ERR
                 return
 
-            query = '''
-                    SELECT region_id, region_code, local_code, name, continent_id, country_id, wikipedia_link, keywords
-                    FROM region
-                    WHERE TRUE
-                    '''
-
-            params = []
-            if input_region_code:
-                query += ' AND region_code = ? '
-                params.append(input_region_code)
-
-            if input_local_code:
-                query += ' AND local_code = ? '
-                params.append(input_local_code)
+            query, params = self._search_query(
+                self._region_search, input_region_code, input_local_code, input_name)
 
-            if input_name:
-                query += ' AND name = ? '
-                params.append(input_name)
-
-            cursor = self._connection.cursor()
+            cursor = self._cursor()
+            cursor.row_factory = _region_factory
             cursor.execute(query, params)
-            rows = cursor.fetchall()
-            if not rows:
-                yield events.ErrorEvent(f"No regions have been found.")
+            # Fetch results in chunks so that the first ones reach the UI as soon as SQLite
+            # produces them, while the UI handles one event per chunk rather than per row.
+            fetch_chunk = cursor.fetchmany
+            make_event = events.RegionSearchResultsEvent
+
+            regions = fetch_chunk(_SEARCH_CHUNK_SIZE)
+            if not regions:
+                yield _NO_REGIONS_ERR
                 return
 
-            for row in rows:
-                region = events.Region(*row)
-                yield events.RegionSearchResultEvent(region)
+            while regions:
+                yield make_event(tuple(regions))
+                regions = fetch_chunk(_SEARCH_CHUNK_SIZE)
 
         except Exception as e:
             yield events.ErrorEvent(f"Failed to search region due to an unexpected error - {e}")
@@ -401,20 +762,21 @@ class Engine:
         """
         try:
             region_id = event.region_id()
-            cursor = self._connection.cursor()
-            query = '''
-                    SELECT region_id, region_code, local_code, name, continent_id, country_id, wikipedia_link, keywords
-                    FROM region
-                    WHERE region_id = ?
-                    '''
-
-            cursor.execute(query, [region_id])
-            row = cursor.fetchone()
-            if row:
-                region = events.Region(*row)
-                yield events.RegionLoadedEvent(region)
+            region = self._cache_get(self._region_cache, region_id)
+            if region:
+                return (events.RegionLoadedEvent(region),)
+
+            query = self._stmts['load_region']
+            cursor = self._cursor()
+            cursor.row_factory = _region_factory
+            cursor.execute(query, (region_id,))
+            region = cursor.fetchone()
+            if region:
+                self._cache_put(self._region_cache, region_id, region)
+                return (events.RegionLoadedEvent(region),)
+            return ()
         except Exception as e:
-            yield events.ErrorEvent(f"Failed to load region due to an unexpected error - {e}")
+            return (events.ErrorEvent(f"Failed to load region due to an unexpected error - {e}"),)
 
 
     def _handle_save_new_region(self, event):
@@ -425,25 +787,50 @@ class Engine:
         """
         try:
             region = event.region()
-            cursor = self._connection.cursor()
-            query = '''
-                    INSERT INTO region (region_id, region_code, local_code, name, continent_id, country_id, wikipedia_link, keywords) 
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    '''
-            cursor.execute(query,
-                           [region.region_id,
-                            region.region_code,
-                            region.local_code,
-                            region.name,
-                            region.continent_id,
-                            region.country_id,
-                            region.wikipedia_link,
-                            region.keywords if region.keywords else None])
-            self._connection.commit()
-            yield events.RegionSavedEvent(region)
+            self._region_cache.pop(region.region_id, None)
+            keywords = region.keywords or None
+            query = self._stmts['save_new_region']
+            self._cursor().execute(query,
+                                   (region.region_id,
+                                    region.region_code,
+                                    region.local_code,
+                                    region.name,
+                                    region.continent_id,
+                                    region.country_id,
+                                    region.wikipedia_link,
+                                    keywords))
+            return (events.RegionSavedEvent(region),)
+        except Exception as e:
+            return (events.SaveRegionFailedEvent(
+                f"Could not save new region because of an error - {e}"),)
+
+    def _handle_save_new_region_bulk(self, event):
+        """
+        Saves many new rows to the table 'region' with a single executemany call inside
+        one transaction (or the current batch), by yielding RegionsSavedEvent.
+        Yields SaveRegionFailedEvent if saving to the database fails, in which case none
+        of the regions are saved.
+        """
+        try:
+            regions = event.regions()
+            for region in regions:
+                self._region_cache.pop(region.region_id, None)
+            query = self._stmts['save_new_region']
+            params = [(region.region_id,
+                       region.region_code,
+                       region.local_code,
+                       region.name,
+                       region.continent_id,
+                       region.country_id,
+                       region.wikipedia_link,
+                       region.keywords or None)
+                      for region in regions]
+
+            self._execute_many(query, params)
+            return (events.RegionsSavedEvent(regions),)
         except Exception as e:
-            yield events.SaveRegionFailedEvent(
-                f"Could not save new region because of an error - {e}")
+            return (events.SaveRegionFailedEvent(
+                f"Could not save new regions because of an error - {e}"),)
 
     def _handle_save_region(self, event):
         """
@@ -453,30 +840,51 @@ class Engine:
         """
         try:
             region = event.region()
-            cursor = self._connection.cursor()
-            query = '''
-                    UPDATE region 
-                    SET region_code = ?, local_code = ?, name = ?, continent_id = ?, country_id = ?, wikipedia_link = ?, keywords = ?
-                    WHERE region_id = ?
-                    '''
+            self._region_cache.pop(region.region_id, None)
+            wikipedia_link = region.wikipedia_link or None
+            keywords = region.keywords or None
+            query = self._stmts['save_region']
+            self._cursor().execute(query,
+                                   (region.region_code,
+                                    region.local_code,
+                                    region.name,
+                                    region.continent_id,
+                                    region.country_id,
+                                    wikipedia_link,
+                                    keywords,
+                                    region.region_id))
+            return (events.RegionSavedEvent(region),)
+        except Exception as e:
+            return (events.SaveRegionFailedEvent(f"Could not update region because of an error - {e}"),)
 
-            cursor.execute(query,
-                           [region.region_code,
-                            region.local_code,
-                            region.name,
-                            region.continent_id,
-                            region.country_id,
-                            region.wikipedia_link if region.wikipedia_link else None,
-                            region.keywords if region.keywords else None,
-                            region.region_id])
-            self._connection.commit()
-            yield events.RegionSavedEvent(region)
+    def _handle_upsert_region(self, event):
+        """
+        Performs a single SQLite query that inserts a region or, if its region_id
+        already exists, updates that row, by yielding RegionSavedEvent.
+        Yields SaveRegionFailedEvent if saving to the database fails.
+        """
+        try:
+            region = event.region()
+            self._region_cache.pop(region.region_id, None)
+            wikipedia_link = region.wikipedia_link or None
+            keywords = region.keywords or None
+            query = self._stmts['upsert_region']
+            self._cursor().execute(query,
+                                   (region.region_id,
+                                    region.region_code,
+                                    region.local_code,
+                                    region.name,
+                                    region.continent_id,
+                                    region.country_id,
+                                    wikipedia_link,
+                                    keywords))
+            return (events.RegionSavedEvent(region),)
         except Exception as e:
-            yield events.SaveRegionFailedEvent(f"Could not update region because of an error - {e}")
+            return (events.SaveRegionFailedEvent(f"Could not save region because of an error - {e}"),)
 
     def _handle_unrecognized(self, event):
         """
         Called if the engine receives an unrecognized event. Yields a customized
         ErrorEvent that communicates this to the user.
         """
-        yield events.ErrorEvent("Received an unrecognized event.")
+        return (_UNRECOGNIZED_EVENT_ERR,)
@@ -13,6 +13,9 @@
 
 
 class ErrorEvent:
+    __slots__ = ('_message',)
+
+
     def __init__(self, message: str):
         self._message = message
 
@@ -27,11 +30,17 @@ class ErrorEvent:
 
 
 class QuitInitiatedEvent:
+    __slots__ = ()
+
+
     def __repr__(self) -> str:
         return f'{type(self).__name__}'
 
 
 
 class EndApplicationEvent:
+    __slots__ = ()
+
+
     def __repr__(self) -> str:
         return f'{type(self).__name__}'
@@ -25,6 +25,9 @@ Continent.__annotations__ = {
 
 
 class StartContinentSearchEvent:
+    __slots__ = ('_continent_code', '_name')
+
+
     def __init__(self, continent_code: str, name: str):
         self._continent_code = continent_code
         self._name = name
@@ -44,6 +47,9 @@ class StartContinentSearchEvent:
 
 
 class ContinentSearchResultEvent:
+    __slots__ = ('_continent',)
+
+
     def __init__(self, continent: Continent):
         self._continent = continent
 
@@ -57,7 +63,27 @@ class ContinentSearchResultEvent:
 
 
 
+class ContinentSearchResultsEvent:
+    __slots__ = ('_continents',)
+
+
+    def __init__(self, continents: tuple[Continent, ...]):
+        self._continents = continents
+
+
+    def continents(self) -> tuple[Continent, ...]:
+        return self._continents
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: continents = {repr(self._continents)}'
+
+
+
 class LoadContinentEvent:
+    __slots__ = ('_continent_id',)
+
+
     def __init__(self, continent_id: int):
         self._continent_id = continent_id
 
@@ -72,6 +98,9 @@ class LoadContinentEvent:
 
 
 class ContinentLoadedEvent:
+    __slots__ = ('_continent',)
+
+
     def __init__(self, continent: Continent):
         self._continent = continent
 
@@ -86,6 +115,9 @@ class ContinentLoadedEvent:
 
 
 class SaveNewContinentEvent:
+    __slots__ = ('_continent',)
+
+
     def __init__(self, continent: Continent):
         self._continent = continent
 
@@ -100,6 +132,9 @@ class SaveNewContinentEvent:
 
 
 class SaveContinentEvent:
+    __slots__ = ('_continent',)
+
+
     def __init__(self, continent: Continent):
         self._continent = continent
 
@@ -114,6 +149,9 @@ class SaveContinentEvent:
 
 
 class ContinentSavedEvent:
+    __slots__ = ('_continent',)
+
+
     def __init__(self, continent: Continent):
         self._continent = continent
 
@@ -128,6 +166,9 @@ class ContinentSavedEvent:
 
 
 class SaveContinentFailedEvent:
+    __slots__ = ('_reason',)
+
+
     def __init__(self, reason: str):
         self._reason = reason
 
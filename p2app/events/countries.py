@@ -30,6 +30,9 @@ Country.__annotations__ = {
 
 
 class StartCountrySearchEvent:
+    __slots__ = ('_country_code', '_name')
+
+
     def __init__(self, country_code: str, name: str):
         self._country_code = country_code
         self._name = name
@@ -49,6 +52,9 @@ class StartCountrySearchEvent:
 
 
 class CountrySearchResultEvent:
+    __slots__ = ('_country',)
+
+
     def __init__(self, country: Country):
         self._country = country
 
@@ -62,7 +68,27 @@ class CountrySearchResultEvent:
 
 
 
+class CountrySearchResultsEvent:
+    __slots__ = ('_countries',)
+
+
+    def __init__(self, countries: tuple[Country, ...]):
+        self._countries = countries
+
+
+    def countries(self) -> tuple[Country, ...]:
+        return self._countries
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: countries = {repr(self._countries)}'
+
+
+
 class LoadCountryEvent:
+    __slots__ = ('_country_id',)
+
+
     def __init__(self, country_id: int):
         self._country_id = country_id
 
@@ -77,6 +103,9 @@ class LoadCountryEvent:
 
 
 class CountryLoadedEvent:
+    __slots__ = ('_country',)
+
+
     def __init__(self, country: Country):
         self._country = country
 
@@ -91,6 +120,9 @@ class CountryLoadedEvent:
 
 
 class SaveNewCountryEvent:
+    __slots__ = ('_country',)
+
+
     def __init__(self, country: Country):
         self._country = country
 
@@ -105,6 +137,9 @@ class SaveNewCountryEvent:
 
 
 class SaveCountryEvent:
+    __slots__ = ('_country',)
+
+
     def __init__(self, country: Country):
         self._country = country
 
@@ -119,6 +154,9 @@ class SaveCountryEvent:
 
 
 class CountrySavedEvent:
+    __slots__ = ('_country',)
+
+
     def __init__(self, country: Country):
         self._country = country
 
@@ -132,7 +170,44 @@ class CountrySavedEvent:
 
 
 
+class SaveNewCountriesEvent:
+    __slots__ = ('_countries',)
+
+
+    def __init__(self, countries: list[Country]):
+        self._countries = countries
+
+
+    def countries(self) -> list[Country]:
+        return self._countries
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: countries = {repr(self._countries)}'
+
+
+
+class CountriesSavedEvent:
+    __slots__ = ('_countries',)
+
+
+    def __init__(self, countries: list[Country]):
+        self._countries = countries
+
+
+    def countries(self) -> list[Country]:
+        return self._countries
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: countries = {repr(self._countries)}'
+
+
+
 class SaveCountryFailedEvent:
+    __slots__ = ('_reason',)
+
+
     def __init__(self, reason: str):
         self._reason = reason
 
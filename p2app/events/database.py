@@ -14,6 +14,9 @@ from pathlib import Path
 
 
 class OpenDatabaseEvent:
+    __slots__ = ('_path',)
+
+
     def __init__(self, path: Path):
         self._path = path
 
@@ -28,12 +31,18 @@ class OpenDatabaseEvent:
 
 
 class CloseDatabaseEvent:
+    __slots__ = ()
+
+
     def __repr__(self) -> str:
         return f'{type(self).__name__}'
 
 
 
 class DatabaseOpenedEvent:
+    __slots__ = ('_path',)
+
+
     def __init__(self, path: Path):
         self._path = path
 
@@ -48,6 +57,9 @@ class DatabaseOpenedEvent:
 
 
 class DatabaseOpenFailedEvent:
+    __slots__ = ('_reason',)
+
+
     def __init__(self, reason: str):
         self._reason = reason
 
@@ -62,5 +74,26 @@ class DatabaseOpenFailedEvent:
 
 
 class DatabaseClosedEvent:
+    __slots__ = ()
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}'
+
+
+
+class BeginBatchEvent:
+    __slots__ = ()
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}'
+
+
+
+class EndBatchEvent:
+    __slots__ = ()
+
+
     def __repr__(self) -> str:
         return f'{type(self).__name__}'
@@ -11,15 +11,49 @@
 # * The user interface's internal events are routed back to the user interface
 #   to be processed, with the engine never seeing them.
 #
+# The engine runs on its own thread, taking events from a request queue and putting
+# its results on a result queue, so that database work never blocks the user
+# interface.  The user interface periodically calls deliver_results to receive them
+# on its own thread.  The user interface's internal events travel through the same
+# queues without being processed by the engine, so they're handled in order with the
+# results of the events sent before them.
+#
 # YOU WILL NOT NEED TO MODIFY THIS FILE AT ALL
 
+import queue
+import threading
+from .app import EndApplicationEvent, ErrorEvent
+
+
+
+class _ViewEvent:
+    """Wraps one of the user interface's internal events on its way through the queues."""
+    __slots__ = ('event',)
+
+
+    def __init__(self, event):
+        self.event = event
+
+
+
+class _DebugModeChange:
+    """Asks the engine thread to turn the engine's own debug mode on or off."""
+    __slots__ = ('enabled',)
+
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+
 
 
 class EventBus:
     def __init__(self):
         self._view = None
         self._engine = None
-        self._is_debug_mode = False
+        self._requests = queue.Queue()
+        self._results = queue.Queue()
+        self.initiate_event = self._initiate_event_release
+        self.deliver_results = self._deliver_results_release
 
 
     def register_view(self, view):
@@ -28,22 +62,97 @@ class EventBus:
 
     def register_engine(self, engine):
         self._engine = engine
+        threading.Thread(target = self._run_engine, daemon = True).start()
 
 
+    # Rather than checking for debug mode on every event, enabling or disabling it
+    # swaps in the matching versions of initiate_event and deliver_results.  The engine
+    # is told too, on its own thread, so that it can trace the SQL it executes.
+
     def enable_debug_mode(self):
-        self._is_debug_mode = True
+        self.initiate_event = self._initiate_event_debug
+        self.deliver_results = self._deliver_results_debug
+        self._requests.put(_DebugModeChange(True))
 
 
     def disable_debug_mode(self):
-        self._is_debug_mode = False
+        self.initiate_event = self._initiate_event_release
+        self.deliver_results = self._deliver_results_release
+        self._requests.put(_DebugModeChange(False))
+
+
+    def initiate_view_event(self, event):
+        self._requests.put(_ViewEvent(event))
+
+
+    def _initiate_event_release(self, event):
+        self._requests.put(event)
+
+
+    def _initiate_event_debug(self, event):
+        print(f'Sent by view  : {event}')
+        self._requests.put(event)
+
+
+    def _deliver_results_release(self):
+        get_result = self._results.get_nowait
+        handle_event = self._view.handle_event
+
+        while True:
+            try:
+                result_event = get_result()
+            except queue.Empty:
+                return
+
+            if type(result_event) is _ViewEvent:
+                handle_event(result_event.event)
+                continue
+
+            handle_event(result_event)
+
+            # The view is destroyed once it handles EndApplicationEvent.
+            if type(result_event) is EndApplicationEvent:
+                return
+
+
+    def _deliver_results_debug(self):
+        get_result = self._results.get_nowait
+        handle_event = self._view.handle_event
+
+        while True:
+            try:
+                result_event = get_result()
+            except queue.Empty:
+                return
+
+            if type(result_event) is _ViewEvent:
+                handle_event(result_event.event)
+                continue
+
+            print(f'Sent by engine: {result_event}')
+            handle_event(result_event)
+
+            # The view is destroyed once it handles EndApplicationEvent.
+            if type(result_event) is EndApplicationEvent:
+                return
+
 
+    def _run_engine(self):
+        put_result = self._results.put
 
-    def initiate_event(self, event):
-        if self._is_debug_mode:
-            print(f'Sent by view  : {event}')
+        for event in iter(self._requests.get, None):
+            if type(event) is _ViewEvent:
+                put_result(event)
+                continue
 
-        for result_event in self._engine.process_event(event):
-            if self._is_debug_mode:
-                print(f'Sent by engine: {result_event}')
+            # An exception escaping here would end this thread, after which the view
+            # would never receive another result.
+            try:
+                if type(event) is _DebugModeChange:
+                    self._engine.set_debug_mode(event.enabled)
+                    continue
 
-            self._view.handle_event(result_event)
+                for result_event in self._engine.process_event(event):
+                    put_result(result_event)
+            except Exception as e:
+                put_result(ErrorEvent(f'The engine failed to process {type(event).__name__} - {e}'))
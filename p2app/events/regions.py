@@ -33,6 +33,9 @@ Region.__annotations__ = {
 
 
 class StartRegionSearchEvent:
+    __slots__ = ('_region_code', '_local_code', '_name')
+
+
     def __init__(self, region_code: str, local_code: str, name: str):
         self._region_code = region_code
         self._local_code = local_code
@@ -58,6 +61,9 @@ class StartRegionSearchEvent:
 
 
 class RegionSearchResultEvent:
+    __slots__ = ('_region',)
+
+
     def __init__(self, region: Region):
         self._region = region
 
@@ -71,7 +77,27 @@ class RegionSearchResultEvent:
 
 
 
+class RegionSearchResultsEvent:
+    __slots__ = ('_regions',)
+
+
+    def __init__(self, regions: tuple[Region, ...]):
+        self._regions = regions
+
+
+    def regions(self) -> tuple[Region, ...]:
+        return self._regions
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: regions = {repr(self._regions)}'
+
+
+
 class LoadRegionEvent:
+    __slots__ = ('_region_id',)
+
+
     def __init__(self, region_id: int):
         self._region_id = region_id
 
@@ -86,6 +112,9 @@ class LoadRegionEvent:
 
 
 class RegionLoadedEvent:
+    __slots__ = ('_region',)
+
+
     def __init__(self, region: Region):
         self._region = region
 
@@ -100,6 +129,9 @@ class RegionLoadedEvent:
 
 
 class SaveNewRegionEvent:
+    __slots__ = ('_region',)
+
+
     def __init__(self, region: Region):
         self._region = region
 
@@ -114,6 +146,26 @@ class SaveNewRegionEvent:
 
 
 class SaveRegionEvent:
+    __slots__ = ('_region',)
+
+
+    def __init__(self, region: Region):
+        self._region = region
+
+
+    def region(self) -> Region:
+        return self._region
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: region = {repr(self._region)}'
+
+
+
+class UpsertRegionEvent:
+    __slots__ = ('_region',)
+
+
     def __init__(self, region: Region):
         self._region = region
 
@@ -128,6 +180,9 @@ class SaveRegionEvent:
 
 
 class RegionSavedEvent:
+    __slots__ = ('_region',)
+
+
     def __init__(self, region: Region):
         self._region = region
 
@@ -141,7 +196,44 @@ class RegionSavedEvent:
 
 
 
+class SaveNewRegionsEvent:
+    __slots__ = ('_regions',)
+
+
+    def __init__(self, regions: list[Region]):
+        self._regions = regions
+
+
+    def regions(self) -> list[Region]:
+        return self._regions
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: regions = {repr(self._regions)}'
+
+
+
+class RegionsSavedEvent:
+    __slots__ = ('_regions',)
+
+
+    def __init__(self, regions: list[Region]):
+        self._regions = regions
+
+
+    def regions(self) -> list[Region]:
+        return self._regions
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: regions = {repr(self._regions)}'
+
+
+
 class SaveRegionFailedEvent:
+    __slots__ = ('_reason',)
+
+
     def __init__(self, reason: str):
         self._reason = reason
 
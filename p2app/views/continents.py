@@ -184,6 +184,10 @@ class _ContinentsSearchView(tkinter.LabelFrame, EventHandler):
             display_name = f'{event.continent().continent_code} - {event.continent().name}'
             self._search_list.insert(tkinter.END, display_name)
             self._search_continent_ids.append(event.continent().continent_id)
+        elif isinstance(event, ContinentSearchResultsEvent):
+            display_names = [f'{continent.continent_code} - {continent.name}' for continent in event.continents()]
+            self._search_list.insert(tkinter.END, *display_names)
+            self._search_continent_ids.extend(continent.continent_id for continent in event.continents())
 
 
 
@@ -185,6 +185,10 @@ class _CountriesSearchView(tkinter.LabelFrame, EventHandler):
             display_name = f'{event.country().country_code} - {event.country().name}'
             self._search_list.insert(tkinter.END, display_name)
             self._search_country_ids.append(event.country().country_id)
+        elif isinstance(event, CountrySearchResultsEvent):
+            display_names = [f'{country.country_code} - {country.name}' for country in event.countries()]
+            self._search_list.insert(tkinter.END, *display_names)
+            self._search_country_ids.extend(country.country_id for country in event.countries())
 
 
 
@@ -24,6 +24,7 @@ _INITIAL_WINDOW_WIDTH = 800
 _INITIAL_WINDOW_HEIGHT = 600
 _PROJECT_NAME = 'ICS 33 - Project 2'
 _MISSING_DATABASE_NAME = '[no database open]'
+_ENGINE_POLL_INTERVAL_MS = 10
 
 
 
@@ -34,13 +35,15 @@ class MainView(tkinter.Tk, EventHandler):
         self.config(menu = MainMenu(self))
         self._event_bus = event_bus
         self._current_view = None
+        self._is_running = False
+        self._is_delivering = False
         self.rowconfigure(0, weight = 1)
         self.columnconfigure(0, weight = 1)
 
 
     def initiate_event(self, event):
         if is_internal_event(event):
-            self.handle_event(event)
+            self._event_bus.initiate_view_event(event)
         else:
             self._event_bus.initiate_event(event)
 
@@ -48,6 +51,8 @@ class MainView(tkinter.Tk, EventHandler):
     def run(self):
         self._switch_view(EmptyView(self))
         self._update_database_path(None)
+        self._is_running = True
+        self._poll_engine()
         self.mainloop()
 
 
@@ -75,6 +80,7 @@ class MainView(tkinter.Tk, EventHandler):
 
     def on_event_post(self, event):
         if isinstance(event, EndApplicationEvent):
+            self._is_running = False
             self.destroy()
         elif isinstance(event, ErrorEvent):
             tkinter.messagebox.showerror('Error', event.message())
@@ -95,3 +101,24 @@ class MainView(tkinter.Tk, EventHandler):
             visible_name = _MISSING_DATABASE_NAME
 
         self.title(f'{_PROJECT_NAME} - {visible_name}')
+
+
+    def _poll_engine(self):
+        if not self._is_running:
+            return
+
+        # Result handlers may open modal dialogs, whose nested event loops keep firing
+        # this timer.  Scheduling the next poll first keeps a single polling chain, and
+        # the guard leaves results queued until the dialog closes rather than delivering
+        # them from inside it.
+        self.after(_ENGINE_POLL_INTERVAL_MS, self._poll_engine)
+
+        if self._is_delivering:
+            return
+
+        self._is_delivering = True
+
+        try:
+            self._event_bus.deliver_results()
+        finally:
+            self._is_delivering = False
@@ -204,6 +204,10 @@ class _RegionsSearchView(tkinter.LabelFrame, EventHandler):
             display_name = f'{event.region().region_code} - {event.region().name}'
             self._search_list.insert(tkinter.END, display_name)
             self._search_region_ids.append(event.region().region_id)
+        elif isinstance(event, RegionSearchResultsEvent):
+            display_names = [f'{region.region_code} - {region.name}' for region in event.regions()]
+            self._search_list.insert(tkinter.END, *display_names)
+            self._search_region_ids.extend(region.region_id for region in event.regions())
 
 
 